@@ -3,46 +3,40 @@ Dynamic Array Implementation in Python
 Demonstrates automatic resizing with doubling/halving capacity
 """
 
-# Remove the DynamicArray class and replace with equivalent functions and variables
-arr = [None]
-size = 0
-capacity = 1
-
-def show():
-    """Display current array state"""
-    elements = [str(arr[i]) for i in range(size)]
-    print(f"sz={size} cap={capacity} [{','.join(elements)}]")
-
-def resize(new_capacity):
-    """Resize the internal array to new capacity"""
-    global arr, capacity
-    new_arr = [None] * new_capacity
-    for i in range(size):
-        new_arr[i] = arr[i]
-    arr = new_arr
-    capacity = new_capacity
-
-def push(value):
-    """Add element to the end of array"""
-    global size, capacity
-    if size == capacity:
-        resize(capacity * 2)
-    arr[size] = value
-    size += 1
-    show()
+class DynamicArray:
+    def __init__(self):
+        # self.arr is a Python list, which already grows geometrically on
+        # append; capacity only tracks the doubling/halving shown by show()
+        self.arr = []
+        self.size = 0
+        self.capacity = 1
+    
+    def show(self):
+        """Display current array state"""
+        elements = [str(x) for x in self.arr]
+        print(f"sz={self.size} cap={self.capacity} [{','.join(elements)}]")
+    
+    def push(self, value):
+        """Add element to the end of array"""
+        if self.size == self.capacity:
+            self.capacity *= 2
+        self.arr.append(value)
+        self.size += 1
+    
+    def pop(self):
+        """Remove and return the last element, or None if the array is empty"""
+        if self.size == 0:
+            return None
+        value = self.arr.pop()
+        self.size -= 1
+        if self.size > 0 and self.size <= self.capacity // 4:
+            self.capacity //= 2
+        return value
 
-def pop():
-    """Remove element from the end of array"""
-    global size, capacity
-    if size == 0:
-        print("Array is empty!")
-        return
-    size -= 1
-    if size > 0 and size <= capacity // 4:
-        resize(capacity // 2)
-    show()
 
 def main():
+    array = DynamicArray()
+    
     print("Dynamic Array Operations:")
     print("1. Push value")
     print("2. Pop value")
@@ -55,11 +49,15 @@ def main():
             
             if choice == 1:
                 value = int(input("Enter value: "))
-                push(value)
+                array.push(value)
+                array.show()
             elif choice == 2:
-                pop()
+                if array.pop() is None:
+                    print("Array is empty!")
+                else:
+                    array.show()
             elif choice == 3:
-                show()
+                array.show()
             elif choice == 4:
                 break
             else:
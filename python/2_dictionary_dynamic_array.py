@@ -3,79 +3,137 @@ Dictionary Implementation using Dynamic Array in Python
 Maps strings to integers with automatic resizing
 """
 
-class Entry:
-    """Represents a key-value pair in the dictionary"""
-    def __init__(self, key, value):
-        self.key = key
-        self.value = value
-    
-    def __repr__(self):
-        return f"({self.key}:{self.value})"
+# Marks an unused slot; keys may be any hashable, including None
+_EMPTY = object()
+
+# Fibonacci hashing: multiply by 2^64 / golden ratio and keep bits
+# [64 - log2(capacity), 64) of the product, so keys whose hashes differ
+# only in their high bits still spread out
+_FIB_MULTIPLIER = 0x9E3779B97F4A7C15
 
 
 class Dictionary:
+    """Open-addressed hash table with Robin Hood linear probing
+    
+    Keys and values live in two parallel lists whose capacity is always a
+    power of two; a key's home slot is the top log2(capacity) bits of its
+    Fibonacci-scrambled hash. A third list records each entry's distance
+    from its home bucket (DFB); insertion evicts any entry closer to home
+    than the one being placed, which keeps probe lengths short and lets
+    lookups stop early. Erasing backward-shifts the probe run instead of
+    leaving tombstones, so the table stays tight without a shrinking
+    rehash; capacity only grows.
+    """
+    MIN_CAPACITY = 8
+    MAX_LOAD = 0.7
+    
     def __init__(self):
-        self.arr = [None]
+        self.capacity = self.MIN_CAPACITY
+        self.shift = 64 - (self.capacity.bit_length() - 1)
+        self.keys = [_EMPTY] * self.capacity
+        self.values = [None] * self.capacity
+        self.dfb = [0] * self.capacity
         self.size = 0
-        self.capacity = 1
     
     def show(self):
         """Display current dictionary state"""
-        elements = [str(self.arr[i]) for i in range(self.size)]
+        elements = [f"({k}:{v})" for k, v in zip(self.keys, self.values)
+                    if k is not _EMPTY]
         print(f"sz={self.size} cap={self.capacity} [{','.join(elements)}]")
     
     def resize(self, new_capacity):
-        """Resize the internal array to new capacity"""
-        new_arr = [None] * new_capacity
-        for i in range(self.size):
-            new_arr[i] = self.arr[i]
-        self.arr = new_arr
+        """Rehash every entry into a table of new_capacity slots"""
+        old_keys, old_values = self.keys, self.values
         self.capacity = new_capacity
+        self.shift = 64 - (new_capacity.bit_length() - 1)
+        self.keys = [_EMPTY] * new_capacity
+        self.values = [None] * new_capacity
+        self.dfb = [0] * new_capacity
+        place = self._place
+        for key, value in zip(old_keys, old_values):
+            if key is not _EMPTY:
+                place(key, value)
+    
+    def _place(self, key, value):
+        """Insert a key known to be absent, displacing richer entries"""
+        keys, values, dfb = self.keys, self.values, self.dfb
+        mask = self.capacity - 1
+        i = ((hash(key) * _FIB_MULTIPLIER) >> self.shift) & mask
+        d = 0
+        while True:
+            if keys[i] is _EMPTY:
+                keys[i] = key
+                values[i] = value
+                dfb[i] = d
+                return
+            if dfb[i] < d:
+                # Resident is closer to home: swap and carry it forward
+                keys[i], key = key, keys[i]
+                values[i], value = value, values[i]
+                dfb[i], d = d, dfb[i]
+            i = (i + 1) & mask
+            d += 1
     
     def find_index(self, key):
-        """Find the index of a key in the array"""
-        for i in range(self.size):
-            if self.arr[i].key == key:
+        """Find the slot holding key, or -1 if it is absent"""
+        keys, dfb = self.keys, self.dfb
+        mask = self.capacity - 1
+        i = ((hash(key) * _FIB_MULTIPLIER) >> self.shift) & mask
+        d = 0
+        while True:
+            k = keys[i]
+            # An entry closer to home than we are means key would have
+            # displaced it on insertion, so key cannot be further along
+            if k is _EMPTY or dfb[i] < d:
+                return -1
+            if k == key:
                 return i
-        return -1
+            i = (i + 1) & mask
+            d += 1
     
     def set(self, key, value):
         """Set a key-value pair (insert or update)"""
         idx = self.find_index(key)
         if idx != -1:
             # Update existing key
-            self.arr[idx].value = value
+            self.values[idx] = value
         else:
             # Insert new key
-            if self.size == self.capacity:
-                self.resize(max(1, self.capacity * 2))
-            self.arr[self.size] = Entry(key, value)
+            if self.size + 1 > self.capacity * self.MAX_LOAD:
+                self.resize(self.capacity * 2)
+            self._place(key, value)
             self.size += 1
-        self.show()
     
     def get(self, key):
-        """Get the value associated with a key"""
+        """Get the value associated with a key, or None if it is absent"""
         idx = self.find_index(key)
         if idx == -1:
-            print("Key not found")
-        else:
-            print(self.arr[idx].value)
+            return None
+        return self.values[idx]
     
     def erase(self, key):
-        """Remove a key-value pair from the dictionary"""
+        """Remove a key-value pair, returning whether the key was present"""
         idx = self.find_index(key)
         if idx == -1:
-            print("Key not found")
-            return
+            return False
         
-        # Move last element to deleted position
-        self.arr[idx] = self.arr[self.size - 1]
+        # Backward-shift deletion: pull the rest of the probe run back one
+        # slot (each entry gets one step closer to home) until reaching an
+        # empty slot or an entry already in its home bucket
+        keys, values, dfb = self.keys, self.values, self.dfb
+        mask = self.capacity - 1
+        j = (idx + 1) & mask
+        while keys[j] is not _EMPTY and dfb[j] > 0:
+            keys[idx] = keys[j]
+            values[idx] = values[j]
+            dfb[idx] = dfb[j] - 1
+            idx = j
+            j = (j + 1) & mask
+        keys[idx] = _EMPTY
+        values[idx] = None
+        dfb[idx] = 0
         self.size -= 1
-        
-        # Shrink if needed
-        if self.size > 0 and self.size <= self.capacity // 4:
-            self.resize(max(1, self.capacity // 2))
-        self.show()
+        return True
 
 
 def main():
@@ -106,6 +164,7 @@ def main():
                     key = command[1]
                     value = int(command[2])
                 dictionary.set(key, value)
+                dictionary.show()
             
             elif cmd == 2:
                 # get key
@@ -113,7 +172,11 @@ def main():
                     key = input("Enter key: ")
                 else:
                     key = command[1]
-                dictionary.get(key)
+                value = dictionary.get(key)
+                if value is None:
+                    print("Key not found")
+                else:
+                    print(value)
             
             elif cmd == 3:
                 # erase key
@@ -121,7 +184,10 @@ def main():
                     key = input("Enter key: ")
                 else:
                     key = command[1]
-                dictionary.erase(key)
+                if dictionary.erase(key):
+                    dictionary.show()
+                else:
+                    print("Key not found")
             
             elif cmd == 4:
                 # show
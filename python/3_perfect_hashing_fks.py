@@ -5,18 +5,21 @@ A practical implementation of perfect hashing that guarantees O(1)
 worst-case lookup time using two levels of hashing.
 
 Level 1: Primary hash table with n buckets using a universal hash function
-Level 2: For each bucket k, create a secondary hash table of size k²
-         to ensure collision-free hashing within that bucket
+Level 2: For each bucket with k keys, build a collision-free secondary
+         hash table of size k². Later keys are stored in the existing
+         table while their slot is free, so a table always holds at least
+         its k keys; a collision rebuilds it at size k² for the new k.
 """
 
 import random
-import time
+import sys
+from array import array
 
 
 class SecondaryTable:
     """Represents a secondary hash table for a bucket"""
     def __init__(self):
-        self.table = []
+        self.table = array('q')  # flat int64 slots, -1 marks an empty slot
         self.size = 0
         self.a = 0
         self.b = 0
@@ -24,37 +27,56 @@ class SecondaryTable:
 
 
 class PerfectHashing:
-    """FKS Perfect Hashing implementation with two-level hashing"""
+    """FKS Perfect Hashing implementation with two-level hashing
+    
+    Keys are integers in [0, MAX_KEY]: buckets and secondary tables store
+    them as int64 ('q') arrays, and -1 marks an empty secondary slot.
+    insert and build raise ValueError for keys outside that range.
+    """
     
     PRIME = 2147483647  # Large prime for universal hashing
+    MAX_KEY = 2**63 - 1  # Largest key an int64 slot can hold
     
     def __init__(self, primary_size=10):
         self.primary_size = primary_size
-        self.buckets = [[] for _ in range(primary_size)]
+        # Each bucket packs its keys as contiguous int64s ('q')
+        self.buckets = [array('q') for _ in range(primary_size)]
         self.second_level = [SecondaryTable() for _ in range(primary_size)]
         
+        # Private generator seeded from OS entropy, so tables never share
+        # hash functions and the global random state is left alone
+        self._rng = random.Random()
+        
         # Initialize Level 1 hash function randomly
-        random.seed(time.time())
         self.a1, self.b1 = self._randomize_hash_function()
     
-    def _hash_function(self, key, a, b, p):
-        """Universal hash function: h(x) = (a*x + b) mod p"""
-        return (a * key + b) % p
-    
     def _randomize_hash_function(self):
         """Generate random hash function parameters"""
-        a = 1 + random.randint(1, self.PRIME - 2)
-        b = random.randint(0, self.PRIME - 1)
+        randint = self._rng.randint
+        p = self.PRIME
+        a = 1 + randint(1, p - 2)
+        b = randint(0, p - 1)
         return a, b
     
-    def _is_collision_free(self, keys, a, b, p, table_size):
-        """Check if hash function h is collision-free for given keys"""
-        hashed = set()
+    def _check_key(self, key):
+        """Reject keys outside [0, MAX_KEY], the range the tables can store"""
+        if not 0 <= key <= self.MAX_KEY:
+            raise ValueError(f"key {key} is outside [0, {self.MAX_KEY}]")
+    
+    def _place_keys(self, keys, a, b, p, table):
+        """Hash keys with h straight into table, stopping at the first collision
+        
+        Hashing, the collision check and placement are a single pass; the
+        table itself marks taken slots (-1 is empty, and _check_key keeps
+        keys non-negative), so no scratch buffer is needed. Returns
+        True if every key was placed.
+        """
+        table_size = len(table)
         for key in keys:
-            h = self._hash_function(key, a, b, p) % table_size
-            if h in hashed:
+            h = (a * key + b) % p % table_size
+            if table[h] != -1:
                 return False
-            hashed.add(h)
+            table[h] = key
         return True
     
     def _build_secondary_table(self, bucket_idx):
@@ -69,7 +91,7 @@ class PerfectHashing:
         
         if k == 1:
             # Single element - no collision possible
-            sec_table.table = [keys[0]]
+            sec_table.table = array('q', [keys[0]])
             sec_table.size = 1
             sec_table.a = 1
             sec_table.b = 0
@@ -80,63 +102,122 @@ class PerfectHashing:
         # Secondary table size is k²
         secondary_size = k * k
         max_attempts = 100
+        empty = array('q', [-1]) * secondary_size
+        table = array('q', empty)
+        p = self.PRIME
+        randomize = self._randomize_hash_function
+        place_keys = self._place_keys
         
         for _ in range(max_attempts):
-            a, b = self._randomize_hash_function()
+            a, b = randomize()
             
-            if self._is_collision_free(keys, a, b, self.PRIME, secondary_size):
+            if place_keys(keys, a, b, p, table):
                 # Found a collision-free hash function
-                sec_table.table = [-1] * secondary_size
+                sec_table.table = table
                 sec_table.size = secondary_size
                 sec_table.a = a
                 sec_table.b = b
-                sec_table.p = self.PRIME
-                
-                # Place keys in secondary table
-                for key in keys:
-                    h = self._hash_function(key, a, b, self.PRIME) % secondary_size
-                    sec_table.table[h] = key
-                
+                sec_table.p = p
                 return True
+            
+            # Undo the partial placement with one block copy
+            table[:] = empty
         
         return False  # Couldn't find collision-free function
     
     def insert(self, key):
         """Insert key into the perfect hash table"""
+        self._check_key(key)
+        
         # Level 1: Insert into appropriate bucket
-        bucket_idx = self._hash_function(key, self.a1, self.b1, self.PRIME) % self.primary_size
+        p = self.PRIME
+        bucket_idx = (self.a1 * key + self.b1) % p % self.primary_size
         self.buckets[bucket_idx].append(key)
         
-        # Level 2: Rebuild secondary table for this bucket
+        # Level 2: Keep the current secondary hash if the key's slot is free;
+        # the table stays collision-free, so no rebuild is needed even though
+        # it may now be smaller than k² for the bucket's new k
+        sec_table = self.second_level[bucket_idx]
+        size = sec_table.size
+        if size > 0:
+            table = sec_table.table
+            h = (sec_table.a * key + sec_table.b) % p % size
+            if table[h] == -1:
+                table[h] = key
+                return True
+        
+        # Otherwise rebuild the secondary table for this bucket
         return self._build_secondary_table(bucket_idx)
     
+    def build(self, keys):
+        """Insert many keys at once, building each affected secondary table once"""
+        # Validate everything up front so a bad key leaves the table untouched
+        keys = list(keys)
+        check_key = self._check_key
+        for key in keys:
+            check_key(key)
+        
+        # Level 1: Partition all keys into their buckets in one pass
+        p = self.PRIME
+        a1, b1, primary_size = self.a1, self.b1, self.primary_size
+        buckets = self.buckets
+        touched = set()
+        for key in keys:
+            bucket_idx = (a1 * key + b1) % p % primary_size
+            buckets[bucket_idx].append(key)
+            touched.add(bucket_idx)
+        
+        # Level 2: Build every touched secondary table exactly once
+        ok = True
+        build_secondary_table = self._build_secondary_table
+        for bucket_idx in touched:
+            if not build_secondary_table(bucket_idx):
+                ok = False
+        return ok
+    
     def search(self, key):
         """Search for a key in the perfect hash table"""
         # Level 1: Find the bucket
-        bucket_idx = self._hash_function(key, self.a1, self.b1, self.PRIME) % self.primary_size
+        p = self.PRIME
+        bucket_idx = (self.a1 * key + self.b1) % p % self.primary_size
         
         # Level 2: Search in secondary table
         sec_table = self.second_level[bucket_idx]
-        
-        if sec_table.size == 0:
+        size = sec_table.size
+        if size == 0:
             return False
         
-        h = self._hash_function(key, sec_table.a, sec_table.b, sec_table.p) % sec_table.size
-        return sec_table.table[h] == key
+        table, a, b = sec_table.table, sec_table.a, sec_table.b
+        return table[(a * key + b) % p % size] == key
+    
+    def search_many(self, keys):
+        """Search for each key in keys, returning a list of booleans"""
+        p = self.PRIME
+        a1, b1, primary_size = self.a1, self.b1, self.primary_size
+        second_level = self.second_level
+        found = []
+        append = found.append
+        for key in keys:
+            sec_table = second_level[(a1 * key + b1) % p % primary_size]
+            size = sec_table.size
+            append(size > 0 and sec_table.table[
+                (sec_table.a * key + sec_table.b) % p % size] == key)
+        return found
     
     def display(self):
         """Display the hash table structure"""
-        print("\n=== Perfect Hashing (FKS Algorithm) Structure ===")
-        print(f"Primary Level: {self.primary_size} buckets\n")
+        # Collect every line and emit them with a single write
+        lines = ["", "=== Perfect Hashing (FKS Algorithm) Structure ===",
+                 f"Primary Level: {self.primary_size} buckets", ""]
         
         for i in range(self.primary_size):
             bucket_keys = self.buckets[i]
-            print(f"Bucket {i} ({len(bucket_keys)} keys): {' '.join(map(str, bucket_keys))}")
+            lines.append(f"Bucket {i} ({len(bucket_keys)} keys): {' '.join(map(str, bucket_keys))}")
             
             if len(bucket_keys) > 0:
                 sec_table = self.second_level[i]
-                print(f"  Secondary Table Size: {sec_table.size} | Hash Function: (a*x + b) mod {sec_table.p}")
-                print(f"  Parameters: a={sec_table.a}, b={sec_table.b}")
+                lines.append(f"  Secondary Table Size: {sec_table.size} | Hash Function: (a*x + b) mod {sec_table.p}")
+                lines.append(f"  Parameters: a={sec_table.a}, b={sec_table.b}")
                 
                 # Show non-empty slots
                 slots = []
@@ -144,27 +225,30 @@ class PerfectHashing:
                     if sec_table.table[j] != -1:
                         slots.append(f"({j}:{sec_table.table[j]})")
                 
-                print(f"  Table Contents: [{' '.join(slots)}", end="")
-                if len(sec_table.table) > 10:
-                    print(" ...", end="")
-                print("]\n")
+                more = " ..." if len(sec_table.table) > 10 else ""
+                lines.append(f"  Table Contents: [{' '.join(slots)}{more}]")
+                lines.append("")
         
-        print()
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def statistics(self):
         """Display hash table statistics"""
-        print("\n=== Hash Table Statistics ===")
+        header = "\n=== Hash Table Statistics ===\n"
         
         total_keys = sum(len(bucket) for bucket in self.buckets)
         avg_bucket_size = total_keys / self.primary_size if self.primary_size > 0 else 0
         max_bucket_size = max(len(bucket) for bucket in self.buckets) if self.buckets else 0
         
-        print(f"Total Keys: {total_keys}")
-        print(f"Primary Table Size: {self.primary_size}")
-        print(f"Average Bucket Size: {avg_bucket_size:.2f}")
-        print(f"Max Bucket Size: {max_bucket_size}")
-        print(f"Load Factor: {total_keys / self.primary_size:.2f}")
-        print()
+        sys.stdout.write(
+            header +
+            f"Total Keys: {total_keys}\n"
+            f"Primary Table Size: {self.primary_size}\n"
+            f"Average Bucket Size: {avg_bucket_size:.2f}\n"
+            f"Max Bucket Size: {max_bucket_size}\n"
+            f"Load Factor: {total_keys / self.primary_size:.2f}\n"
+            "\n"
+        )
 
 
 def main():
@@ -216,8 +300,8 @@ def main():
     print("\nTest 4: Final search verification:")
     final_search_keys = [10, 25, 35, 45, 15, 20, 30, 50, 60, 70, 99]
     
-    for key in final_search_keys:
-        if hash_table.search(key):
+    for key, found in zip(final_search_keys, hash_table.search_many(final_search_keys)):
+        if found:
             print(f"✓ Key {key} found")
         else:
             print(f"✗ Key {key} not found")
@@ -229,7 +313,8 @@ def main():
     print("• Average-case insertion time: O(1)")
     print("• Space complexity: O(n)")
     print("• Uses universal hashing at both levels")
-    print("• Secondary table size = k² for k keys in bucket")
+    print("• Secondary table built at size k² for k keys in bucket")
+    print("• Fits later keys while slots are free, rebuilt to k² on collision")
     print("• Guarantees collision-free hashing")
 
 